@@ -0,0 +1,435 @@
+"""HTTP client for the Phosphobot control server driving EdamaruKun Mk-II.
+
+Wraps the two endpoints the arm control loop needs (``/move/init`` and
+``/move/absolute``) with input validation against :class:`MovementLimits`
+and simple retry handling for transient failures.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# The /move/absolute schema is fixed, so the body is rendered with one
+# C-level %-format instead of dict construction + a generic JSON encoder.
+_MOVE_TEMPLATE = (
+    b'{"x_cm":%.6f,"y_cm":%.6f,"z_cm":%.6f,'
+    b'"roll_deg":%.6f,"pitch_deg":%.6f,"yaw_deg":%.6f,"grip":%d}'
+)
+
+
+class PhosphobotClientError(Exception):
+    """Base class for errors raised by :class:`PhosphobotClient`."""
+
+
+class ValidationError(PhosphobotClientError):
+    """A command argument is outside the configured movement limits."""
+
+
+class HTTPError(PhosphobotClientError):
+    """The Phosphobot API returned an error response.
+
+    ``status_code`` is -1 when the failure happened below HTTP
+    (connection refused, DNS, etc.).
+    """
+
+    def __init__(self, status_code: int, message: str, response_body: bytes | None = None):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.response_body = response_body
+
+    @property
+    def body_text(self) -> str | None:
+        """The response body decoded on demand, or None if absent."""
+        if self.response_body is None:
+            return None
+        return self.response_body.decode("utf-8", errors="replace")
+
+
+@dataclass(frozen=True, slots=True)
+class MovementLimits:
+    """Allowed ranges for ``/move/absolute`` arguments.
+
+    Cartesian ranges are in centimetres, angles in degrees, matching the
+    Phosphobot API. Defaults are derived from the EdamaruKun Mk-II link
+    lengths in ``edamaru_ark.yaml`` (reach ~22 cm).
+    """
+
+    x_cm: tuple[float, float] = (-22.0, 22.0)
+    y_cm: tuple[float, float] = (-22.0, 22.0)
+    z_cm: tuple[float, float] = (0.0, 26.0)
+    roll_deg: tuple[float, float] = (-180.0, 180.0)
+    pitch_deg: tuple[float, float] = (-90.0, 90.0)
+    yaw_deg: tuple[float, float] = (-90.0, 90.0)
+    grip: tuple[int, int] = (0, 1)
+    # Declared as fields so the generated __slots__ has room for them.
+    _lo: np.ndarray = field(init=False, repr=False, compare=False)
+    _hi: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Prepared bound arrays for the vectorized range check in
+        # _validate_move; frozen=True, so bypass __setattr__.
+        ranges = (self.x_cm, self.y_cm, self.z_cm, self.roll_deg, self.pitch_deg, self.yaw_deg)
+        object.__setattr__(self, "_lo", np.array([r[0] for r in ranges], dtype=np.float64))
+        object.__setattr__(self, "_hi", np.array([r[1] for r in ranges], dtype=np.float64))
+
+    def get_range(self, name: str) -> tuple[float, float]:
+        """Return the ``(lower, upper)`` range for a field by name."""
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(f"Unknown limit field: {name!r}") from None
+
+
+DEFAULT_LIMITS = MovementLimits()
+
+
+class PhosphobotClient:
+    """Synchronous client for a single Phosphobot server.
+
+    A dedicated keep-alive connection pool is mounted for the server so
+    that streamed move commands reuse one TCP connection instead of
+    paying a handshake per request.
+    """
+
+    # Statuses worth retrying: timeouts, throttling, and transient server
+    # failures. Other 4xx responses are the caller's fault and fail fast.
+    _RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:80",
+        timeout_sec: float = 5.0,
+        max_retries: int = 3,
+        limits: MovementLimits | None = None,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 5.0,
+        backoff_jitter: float = 0.5,
+        total_timeout_sec: float | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout_sec = timeout_sec
+        self.max_retries = max_retries
+        # Bound on the user-visible latency of one command: per-attempt
+        # timeouts shrink to the remaining budget and no retry sleeps past
+        # the deadline, so overshoot is at most one in-flight attempt.
+        self.total_timeout_sec = (
+            total_timeout_sec if total_timeout_sec is not None else timeout_sec * max_retries
+        )
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+        self._backoff_jitter = backoff_jitter
+        self.limits = limits if limits is not None else DEFAULT_LIMITS
+        self._session = requests.Session()
+        # All traffic goes to one host: a single blocking-free pool entry
+        # sized for the retry burst is enough, and keep-alive avoids a TCP
+        # handshake on every command. Adapter-level retries stay disabled:
+        # urllib3-internal attempts cannot observe the request deadline and
+        # would mangle the timeout exception mapping, so _request owns the
+        # whole retry policy.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(4, max_retries),
+            pool_block=False,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {
+                "Connection": "keep-alive",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+        )
+        # The control loop only ever hits these two endpoints; build the
+        # full URLs once instead of on every request.
+        self._endpoints = {
+            "/move/init": f"{self.base_url}/move/init",
+            "/move/absolute": f"{self.base_url}/move/absolute",
+        }
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "PhosphobotClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def move_init(self) -> dict[str, Any]:
+        """Move the arm to its initial pose."""
+        logger.info("Sending move init command")
+        return self._request("POST", "/move/init")
+
+    def move_absolute(
+        self,
+        x_cm: float,
+        y_cm: float,
+        z_cm: float,
+        roll_deg: float = 0.0,
+        pitch_deg: float = 0.0,
+        yaw_deg: float = 0.0,
+        grip: int = 0,
+    ) -> dict[str, Any]:
+        """Move the end effector to an absolute pose.
+
+        Raises :class:`ValidationError` if any argument is outside the
+        configured :class:`MovementLimits`.
+        """
+        payload, body = self._validate_move(x_cm, y_cm, z_cm, roll_deg, pitch_deg, yaw_deg, grip)
+        # Guarded so the seven-argument tuple is not built per command
+        # when INFO is disabled.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Sending absolute move command to (x=%.2fcm, y=%.2fcm, z=%.2fcm, "
+                "roll=%.1f, pitch=%.1f, yaw=%.1f, grip=%d)",
+                payload["x_cm"],
+                payload["y_cm"],
+                payload["z_cm"],
+                payload["roll_deg"],
+                payload["pitch_deg"],
+                payload["yaw_deg"],
+                payload["grip"],
+            )
+        return self._request("POST", "/move/absolute", body=body)
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def _validate_move(
+        self,
+        x_cm: float,
+        y_cm: float,
+        z_cm: float,
+        roll_deg: float,
+        pitch_deg: float,
+        yaw_deg: float,
+        grip: int,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Validate a move command, returning ``(payload, body_bytes)``.
+
+        The dict is for logging and inspection; the bytes are the
+        ready-to-send JSON body.
+        """
+        limits = self.limits
+        raw = (x_cm, y_cm, z_cm, roll_deg, pitch_deg, yaw_deg)
+        values = None
+        # np.array silently coerces bool to 1.0 and parses numeric
+        # strings; only exact ints and floats take the fast path, so any
+        # other type is rejected by the scalar validators below.
+        if all(type(v) is float or type(v) is int for v in raw):
+            try:
+                values = np.array(raw, dtype=np.float64)
+            except (TypeError, ValueError):
+                values = None
+        if (
+            values is None
+            or not np.isfinite(values).all()
+            or (values < limits._lo).any()
+            or (values > limits._hi).any()
+        ):
+            # Slow path: the scalar validators raise the precise error for
+            # the offending field, and coerce values the fast path does
+            # not handle (numpy scalars, int subclasses) to plain float.
+            x, y, z, roll, pitch, yaw = (
+                self._validate_numeric(name, value, limits.get_range(name))
+                for name, value in zip(
+                    ("x_cm", "y_cm", "z_cm", "roll_deg", "pitch_deg", "yaw_deg"), raw
+                )
+            )
+        else:
+            x, y, z, roll, pitch, yaw = values.tolist()
+        grip = self._validate_grip(grip, limits.grip)
+        payload = {
+            "x_cm": x,
+            "y_cm": y,
+            "z_cm": z,
+            "roll_deg": roll,
+            "pitch_deg": pitch,
+            "yaw_deg": yaw,
+            "grip": grip,
+        }
+        return payload, _MOVE_TEMPLATE % (x, y, z, roll, pitch, yaw, grip)
+
+    @staticmethod
+    def _validate_numeric(
+        name: str,
+        value: float,
+        rng: tuple[float, float],
+        *,
+        _isfinite=math.isfinite,
+        _float=float,
+    ) -> float:
+        # The keyword-only defaults bind hot globals as locals (LOAD_FAST
+        # instead of LOAD_GLOBAL/LOAD_ATTR per call). Exact-type check
+        # first: a single pointer compare covers the common case, with the
+        # isinstance fallback for ints and numpy scalars (bool excluded
+        # either way, since type(True) is bool).
+        if type(value) is not _float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValidationError(f"{name} must be a number, got {type(value).__name__}")
+            value = _float(value)
+        if not _isfinite(value):
+            raise ValidationError(f"{name} must be finite, got {value!r}")
+        lower, upper = rng
+        if not (lower <= value <= upper):
+            raise ValidationError(
+                f"{name}={value:.2f} is outside the allowed range [{lower:.2f}, {upper:.2f}]"
+            )
+        return value
+
+    @staticmethod
+    def _validate_grip(grip: int, grip_range: tuple[int, int]) -> int:
+        # Exact type check: one pointer compare, and it already excludes
+        # bool since type(True) is bool, not int.
+        if type(grip) is not int:
+            raise ValidationError(f"grip must be an integer, got {type(grip).__name__}")
+        lower, upper = grip_range
+        if not (lower <= grip <= upper):
+            raise ValidationError(f"grip={grip} is outside the allowed range [{lower}, {upper}]")
+        return grip
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _build_url(self, path: str) -> str:
+        return self._endpoints.get(path) or f"{self.base_url}/{path.lstrip('/')}"
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Randomized jitter keeps concurrent clients from retrying in
+        # lockstep against a recovering server.
+        delay = min(self._backoff_cap, self._backoff_base * 2 ** (attempt - 1))
+        return delay * (1.0 + random.random() * self._backoff_jitter)
+
+    @staticmethod
+    def _extract_error_message(parsed: Any, raw_body: bytes) -> str:
+        if isinstance(parsed, dict):
+            for key in ("detail", "message", "error"):
+                if key in parsed:
+                    return str(parsed[key])
+        # Decode only a short snippet so a huge HTML error page is not
+        # materialized as text in full.
+        snippet = raw_body[:200].decode("utf-8", "replace").strip()
+        return snippet or "Phosphobot API returned an error."
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: bytes | None = None,
+        _Timeout=requests.Timeout,
+        _ConnectionError=requests.ConnectionError,
+        _RequestException=requests.RequestException,
+        _sleep=time.sleep,
+        _monotonic=time.monotonic,
+    ) -> dict[str, Any]:
+        # Payloads arrive pre-serialized so requests does not run its own
+        # json.dumps per call; Content-Type is already set on the session.
+        url = self._build_url(path)
+        # Loop invariants, bound once instead of per attempt.
+        do_request = self._session.request
+        method_upper = method.upper()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Deadline model: each attempt gets whatever budget is left, so
+        # the caller never waits longer than total_timeout_sec.
+        deadline = _monotonic() + self.total_timeout_sec
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if debug_enabled:
+                    logger.debug("%s %s attempt %d body=%s", method_upper, url, attempt, body)
+                response = do_request(
+                    method=method_upper,
+                    url=url,
+                    data=body,
+                    timeout=min(self.timeout_sec, max(0.01, deadline - _monotonic())),
+                )
+            except _Timeout:
+                if attempt >= self.max_retries:
+                    raise TimeoutError(
+                        f"{method} {url} timed out after {attempt} attempts"
+                    ) from None
+                delay = self._backoff_delay(attempt)
+                if _monotonic() + delay >= deadline:
+                    raise TimeoutError(
+                        f"{method} {url} exceeded the {self.total_timeout_sec:.1f}s deadline "
+                        f"after {attempt} attempts"
+                    ) from None
+                _sleep(delay)
+                continue
+            except _ConnectionError as exc:
+                # Connection refused/reset is as transient as a timeout
+                # while the server restarts; retry it the same way.
+                if attempt >= self.max_retries:
+                    raise HTTPError(-1, str(exc)) from exc
+                delay = self._backoff_delay(attempt)
+                if _monotonic() + delay >= deadline:
+                    raise HTTPError(
+                        -1,
+                        f"{exc} (gave up at the {self.total_timeout_sec:.1f}s deadline)",
+                    ) from exc
+                _sleep(delay)
+                continue
+            except _RequestException as exc:
+                raise HTTPError(-1, str(exc)) from exc
+            body_bytes = response.content
+            status = response.status_code
+            if status >= 400:
+                if status in self._RETRYABLE_STATUS and attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt)
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after is not None:
+                        try:
+                            delay = float(retry_after)
+                        except ValueError:
+                            pass
+                    # A sleep that would cross the deadline is not worth
+                    # it; raise the status error below instead.
+                    if _monotonic() + delay < deadline:
+                        _sleep(delay)
+                        continue
+                # Only parse declared-JSON error bodies; proxies tend to
+                # answer with large HTML pages.
+                parsed = None
+                if body_bytes and "json" in response.headers.get("Content-Type", ""):
+                    try:
+                        parsed = _json_loads(body_bytes)
+                    except ValueError:
+                        parsed = None
+                raise HTTPError(
+                    status,
+                    self._extract_error_message(parsed, body_bytes),
+                    body_bytes,
+                )
+            try:
+                payload = _json_loads(body_bytes) if body_bytes else None
+            except ValueError:
+                payload = None
+            return payload if payload is not None else {}
@@ -0,0 +1,121 @@
+"""Async HTTP client for the Phosphobot control server.
+
+Mirrors the :class:`phosphobot_client.PhosphobotClient` API on top of
+``httpx.AsyncClient`` so trajectory playback can keep several waypoints
+in flight at once instead of serializing one round trip per command::
+
+    async with AsyncPhosphobotClient("http://robot:80") as client:
+        await asyncio.gather(*(client.move_absolute(*wp) for wp in trajectory))
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from phosphobot_client import (
+    DEFAULT_LIMITS,
+    HTTPError,
+    MovementLimits,
+    PhosphobotClient,
+    _json_loads,
+)
+
+
+class AsyncPhosphobotClient:
+    """Asynchronous client for a single Phosphobot server.
+
+    Validation is shared with the sync client; transport-level retries
+    are not — batch callers are expected to handle waypoint failures
+    themselves. Pass ``http2=True`` for multiplexing when ``httpx[http2]``
+    is installed; the default keep-alive HTTP/1.1 pool already allows
+    four concurrent in-flight requests.
+    """
+
+    # Reuse the sync client's validation; these only touch self.limits.
+    _validate_move = PhosphobotClient._validate_move
+    _validate_numeric = staticmethod(PhosphobotClient._validate_numeric)
+    _validate_grip = staticmethod(PhosphobotClient._validate_grip)
+    _extract_error_message = staticmethod(PhosphobotClient._extract_error_message)
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:80",
+        timeout_sec: float = 5.0,
+        limits: MovementLimits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout_sec = timeout_sec
+        self.limits = limits if limits is not None else DEFAULT_LIMITS
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout_sec,
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPhosphobotClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def move_init(self) -> dict[str, Any]:
+        """Move the arm to its initial pose."""
+        return await self._request("POST", "/move/init")
+
+    async def move_absolute(
+        self,
+        x_cm: float,
+        y_cm: float,
+        z_cm: float,
+        roll_deg: float = 0.0,
+        pitch_deg: float = 0.0,
+        yaw_deg: float = 0.0,
+        grip: int = 0,
+    ) -> dict[str, Any]:
+        """Move the end effector to an absolute pose.
+
+        Raises :class:`phosphobot_client.ValidationError` if any argument
+        is outside the configured :class:`MovementLimits`.
+        """
+        _, body = self._validate_move(x_cm, y_cm, z_cm, roll_deg, pitch_deg, yaw_deg, grip)
+        return await self._request("POST", "/move/absolute", body=body)
+
+    async def _request(self, method: str, path: str, *, body: bytes | None = None) -> dict[str, Any]:
+        try:
+            response = await self._client.request(method, path, content=body)
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(f"{method} {path} timed out") from exc
+        except httpx.HTTPError as exc:
+            raise HTTPError(-1, str(exc)) from exc
+        body_bytes = response.content
+        if response.status_code >= 400:
+            parsed = None
+            if body_bytes and "json" in response.headers.get("Content-Type", ""):
+                try:
+                    parsed = _json_loads(body_bytes)
+                except ValueError:
+                    parsed = None
+            raise HTTPError(
+                response.status_code,
+                self._extract_error_message(parsed, body_bytes),
+                body_bytes,
+            )
+        try:
+            payload = _json_loads(body_bytes) if body_bytes else None
+        except ValueError:
+            payload = None
+        return payload if payload is not None else {}
@@ -0,0 +1,102 @@
+"""Command-line control of the EdamaruKun Mk-II arm via Phosphobot.
+
+Usage::
+
+    python so101ctl.py [--base-url URL] [--limits limits.json] init
+    python so101ctl.py move X_CM Y_CM Z_CM [--roll R] [--pitch P] [--yaw Y] [--grip G]
+
+The optional limits file is a JSON object mapping :class:`MovementLimits`
+field names to ``[lower, upper]`` pairs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+
+from phosphobot_client import (
+    MovementLimits,
+    PhosphobotClient,
+    PhosphobotClientError,
+    _json_loads,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_limits_cached(path: str, mtime_ns: int, size: int) -> MovementLimits:
+    # mtime_ns and size are part of the cache key only: a rewritten file
+    # misses the cache and is re-parsed.
+    with open(path, "rb") as fh:
+        raw = _json_loads(fh.read())
+    if not isinstance(raw, dict):
+        raise ValueError(f"{path}: limits file must be a JSON object")
+    ranges = {}
+    for name, rng in raw.items():
+        if not isinstance(rng, (list, tuple)) or len(rng) != 2:
+            raise ValueError(f"{path}: {name} must be a [lower, upper] pair")
+        ranges[name] = tuple(rng)
+    return MovementLimits(**ranges)
+
+
+def load_limits(path: str) -> MovementLimits:
+    """Load :class:`MovementLimits` from a JSON file.
+
+    Parsed limits are cached per ``(path, mtime, size)`` so daemon-style
+    callers re-invoking commands do not re-pay file I/O and parsing.
+    """
+    st = os.stat(path)
+    return _load_limits_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="so101ctl",
+        description="Send move commands to a Phosphobot-controlled SO-101 arm.",
+    )
+    parser.add_argument("--base-url", default="http://127.0.0.1:80")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--limits", help="JSON file overriding the default movement limits")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("init", help="move the arm to its initial pose")
+    move = sub.add_parser("move", help="move the end effector to an absolute pose")
+    move.add_argument("x_cm", type=float)
+    move.add_argument("y_cm", type=float)
+    move.add_argument("z_cm", type=float)
+    move.add_argument("--roll", type=float, default=0.0)
+    move.add_argument("--pitch", type=float, default=0.0)
+    move.add_argument("--yaw", type=float, default=0.0)
+    move.add_argument("--grip", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    limits = None
+    if args.limits:
+        try:
+            limits = load_limits(args.limits)
+        except (OSError, ValueError, TypeError) as exc:
+            print(f"so101ctl: failed to load limits from {args.limits}: {exc}", file=sys.stderr)
+            return 1
+    try:
+        with PhosphobotClient(args.base_url, timeout_sec=args.timeout, limits=limits) as client:
+            if args.command == "init":
+                result = client.move_init()
+            else:
+                result = client.move_absolute(
+                    args.x_cm,
+                    args.y_cm,
+                    args.z_cm,
+                    roll_deg=args.roll,
+                    pitch_deg=args.pitch,
+                    yaw_deg=args.yaw,
+                    grip=args.grip,
+                )
+    except (PhosphobotClientError, TimeoutError) as exc:
+        print(f"so101ctl: {exc}", file=sys.stderr)
+        return 1
+    print(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
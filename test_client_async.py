@@ -0,0 +1,75 @@
+"""Behavioral tests for AsyncPhosphobotClient over a mocked transport."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from phosphobot_client import HTTPError, ValidationError
+from phosphobot_client_async import AsyncPhosphobotClient
+
+
+def make_client(handler):
+    return AsyncPhosphobotClient(
+        "http://robot", timeout_sec=0.2, transport=httpx.MockTransport(handler)
+    )
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_move_absolute_sends_validated_payload():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, request.content))
+        return httpx.Response(200, json={"status": "ok"})
+
+    async def scenario():
+        async with make_client(handler) as client:
+            return await client.move_absolute(1, 2.5, 3.0, grip=1)
+
+    assert run(scenario()) == {"status": "ok"}
+    path, content = seen[0]
+    assert path == "/move/absolute"
+    assert b'"x_cm":1.000000' in content
+    assert b'"grip":1' in content
+
+
+def test_async_400_fails_fast_with_extracted_message():
+    def handler(request):
+        return httpx.Response(400, json={"detail": "pose unreachable"})
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.move_init()
+
+    with pytest.raises(HTTPError) as excinfo:
+        run(scenario())
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.message == "pose unreachable"
+
+
+def test_async_timeout_maps_to_timeout_error():
+    def handler(request):
+        raise httpx.ReadTimeout("read timed out")
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.move_init()
+
+    with pytest.raises(TimeoutError):
+        run(scenario())
+
+
+def test_async_validation_rejected_before_any_request():
+    def handler(request):
+        raise AssertionError("no request should be sent")
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.move_absolute(999.0, 0.0, 10.0)
+
+    with pytest.raises(ValidationError, match="x_cm"):
+        run(scenario())
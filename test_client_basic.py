@@ -0,0 +1,128 @@
+"""Basic behavioral tests for PhosphobotClient retry and validation paths."""
+
+import socket
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from phosphobot_client import (
+    HTTPError,
+    MovementLimits,
+    PhosphobotClient,
+    ValidationError,
+)
+
+
+def make_response(status, headers=None, content=b"{}"):
+    response = mock.Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.content = content
+    return response
+
+
+@pytest.fixture
+def hung_server():
+    """A server that accepts connections and never responds."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(5)
+    accepted = []
+
+    def accept_loop():
+        while True:
+            try:
+                accepted.append(server.accept())
+            except OSError:
+                return
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    yield f"http://127.0.0.1:{server.getsockname()[1]}"
+    server.close()
+    for conn, _ in accepted:
+        conn.close()
+
+
+def test_timeout_retry(hung_server):
+    client = PhosphobotClient(
+        hung_server,
+        timeout_sec=0.2,
+        max_retries=3,
+        total_timeout_sec=1.0,
+        backoff_base=0.05,
+        backoff_jitter=0.0,
+    )
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.move_init()
+    assert time.monotonic() - start < 1.2
+
+
+def test_persistent_503_raises_after_retries():
+    client = PhosphobotClient(
+        "http://robot", max_retries=3, backoff_base=0.001, backoff_jitter=0.0
+    )
+    response = make_response(503)
+    with mock.patch.object(client._session, "request", return_value=response) as req:
+        with pytest.raises(HTTPError) as excinfo:
+            client.move_init()
+    assert excinfo.value.status_code == 503
+    assert req.call_count == 3
+
+
+def test_400_fails_fast_with_extracted_message():
+    client = PhosphobotClient("http://robot", max_retries=3)
+    response = make_response(
+        400,
+        headers={"Content-Type": "application/json"},
+        content=b'{"detail": "pose unreachable"}',
+    )
+    with mock.patch.object(client._session, "request", return_value=response) as req:
+        with pytest.raises(HTTPError) as excinfo:
+            client.move_absolute(1.0, 2.0, 3.0)
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.message == "pose unreachable"
+    assert req.call_count == 1
+
+
+def test_connection_error_retried_then_raised():
+    client = PhosphobotClient(
+        "http://robot", max_retries=2, backoff_base=0.001, backoff_jitter=0.0
+    )
+    error = requests.ConnectionError("connection refused")
+    with mock.patch.object(client._session, "request", side_effect=error) as req:
+        with pytest.raises(HTTPError) as excinfo:
+            client.move_init()
+    assert excinfo.value.status_code == -1
+    assert req.call_count == 2
+
+
+def test_validate_move_rejects_wrong_types():
+    client = PhosphobotClient("http://robot")
+    with pytest.raises(ValidationError, match="bool"):
+        client._validate_move(True, 0.0, 10.0, 0.0, 0.0, 0.0, 0)
+    with pytest.raises(ValidationError, match="str"):
+        client._validate_move("1", 0.0, 10.0, 0.0, 0.0, 0.0, 0)
+    with pytest.raises(ValidationError, match="grip"):
+        client._validate_move(0.0, 0.0, 10.0, 0.0, 0.0, 0.0, True)
+
+
+def test_validate_move_rejects_out_of_range():
+    client = PhosphobotClient("http://robot", limits=MovementLimits(x_cm=(-5.0, 5.0)))
+    with pytest.raises(ValidationError, match="x_cm"):
+        client._validate_move(6.0, 0.0, 10.0, 0.0, 0.0, 0.0, 0)
+    with pytest.raises(ValidationError, match="finite"):
+        client._validate_move(0.0, float("nan"), 10.0, 0.0, 0.0, 0.0, 0)
+    with pytest.raises(ValidationError, match="grip"):
+        client._validate_move(0.0, 0.0, 10.0, 0.0, 0.0, 0.0, 5)
+
+
+def test_validate_move_accepts_valid_command():
+    client = PhosphobotClient("http://robot")
+    payload, body = client._validate_move(1, 2.5, 3.0, 10.0, 0.0, -5.0, 1)
+    assert payload["x_cm"] == 1.0
+    assert payload["grip"] == 1
+    assert b'"grip":1' in body